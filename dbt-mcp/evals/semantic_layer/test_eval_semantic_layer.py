@@ -14,7 +14,7 @@ from openai.types.responses.response_input_param import FunctionCallOutput
 
 from client.tools import get_tools
 from dbt_mcp.config.config import load_config
-from dbt_mcp.mcp.server import create_dbt_mcp
+from dbt_mcp.mcp.server import DbtMCP, create_dbt_mcp
 from dbt_mcp.semantic_layer.client import (
     DefaultSemanticLayerClientProvider,
     SemanticLayerFetcher,
@@ -24,6 +24,15 @@ from dbt_mcp.semantic_layer.types import OrderByParam, QueryMetricsSuccess
 LLM_MODEL = "gpt-4o-mini"
 llm_client = OpenAI()
 config = load_config()
+_dbt_mcp: DbtMCP | None = None
+
+
+async def get_dbt_mcp() -> DbtMCP:
+    # Share one server across tool calls and tests instead of rebuilding it
+    global _dbt_mcp
+    if _dbt_mcp is None:
+        _dbt_mcp = await create_dbt_mcp(config)
+    return _dbt_mcp
 
 
 async def expect_metadata_tool_call(
@@ -46,7 +55,7 @@ async def expect_metadata_tool_call(
     assert tool_call.type == "function_call"
     assert function_name == expected_tool
     assert expected_arguments is None or function_arguments == expected_arguments
-    tool_response = await (await create_dbt_mcp(config)).call_tool(
+    tool_response = await (await get_dbt_mcp()).call_tool(
         function_name,
         json.loads(function_arguments),
     )
@@ -162,11 +171,10 @@ def initial_messages(content: str) -> ResponseInputParam:
     ],
 )
 async def test_explicit_tool_request(content: str, expected_tool: str):
-    dbt_mcp = await create_dbt_mcp(config)
     response = llm_client.responses.create(
         model=LLM_MODEL,
         input=initial_messages(content),
-        tools=await get_tools(dbt_mcp),
+        tools=await get_tools(await get_dbt_mcp()),
         parallel_tool_calls=False,
     )
     assert len(response.output) == 1
@@ -175,7 +183,7 @@ async def test_explicit_tool_request(content: str, expected_tool: str):
 
 
 async def test_semantic_layer_fulfillment_query():
-    tools = await get_tools()
+    tools = await get_tools(await get_dbt_mcp())
     messages = initial_messages(
         "How many orders did we fulfill this month last year?",
     )
@@ -199,7 +207,7 @@ async def test_semantic_layer_fulfillment_query():
 
 
 async def test_semantic_layer_food_revenue_per_month():
-    tools = await get_tools()
+    tools = await get_tools(await get_dbt_mcp())
     messages = initial_messages(
         "What is our food revenue per location per month?",
     )
@@ -247,7 +255,7 @@ async def test_semantic_layer_food_revenue_per_month():
 
 
 async def test_semantic_layer_what_percentage_of_orders_were_large():
-    tools = await get_tools()
+    tools = await get_tools(await get_dbt_mcp())
     messages = initial_messages(
         "What percentage of orders were large this year?",
     )
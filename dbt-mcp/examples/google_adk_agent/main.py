@@ -52,7 +52,7 @@ async def main():
 
     while True:
         try:
-            user_input = input("User > ").strip()
+            user_input = (await asyncio.to_thread(input, "User > ")).strip()
 
             if user_input.lower() in {"quit", "exit", "q"}:
                 print("Goodbye!")
@@ -61,19 +61,18 @@ async def main():
             if not user_input:
                 continue
 
-            events = runner.run(
+            async for event in runner.run_async(
                 user_id="user",
                 session_id="session_1",
                 new_message=types.Content(
                     role="user", parts=[types.Part(text=user_input)]
                 ),
-            )
-
-            for event in events:
-                if hasattr(event, "content") and hasattr(event.content, "parts"):
-                    for part in event.content.parts:
-                        if hasattr(part, "text") and part.text:
-                            print(f"Assistant: {part.text}")
+            ):
+                if event.content is None or not event.content.parts:
+                    continue
+                for part in event.content.parts:
+                    if part.text:
+                        print(f"Assistant: {part.text}")
 
         except (EOFError, KeyboardInterrupt):
             print("\nGoodbye!")
@@ -2,40 +2,56 @@
 
 import asyncio
 import os
+import sys
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.prebuilt import create_react_agent
+REQUIRED_ENV_VARS = (
+    "DBT_HOST",
+    "DBT_USER_ID",
+    "DBT_PROD_ENV_ID",
+    "DBT_DEV_ENV_ID",
+    "DBT_TOKEN",
+)
+
+
+def _content_parts(item):
+    for message in item["agent"]["messages"]:
+        content = message.content
+        if type(content) is list:
+            yield from content
+        else:
+            yield content
 
 
 def print_stream_item(item):
     if "agent" in item:
-        content = [
-            part
-            for message in item["agent"]["messages"]
-            for part in (
-                message.content
-                if isinstance(message.content, list)
-                else [message.content]
-            )
-        ]
-        for c in content:
+        # Write each stream item in one call rather than one print per part
+        lines = []
+        for c in _content_parts(item):
             if isinstance(c, str):
-                print(f"Agent > {c}")
+                lines.append(f"Agent > {c}\n")
             elif "text" in c:
-                print(f"Agent > {c['text']}")
+                lines.append(f"Agent > {c['text']}\n")
             elif c["type"] == "tool_use":
-                print(f"    using tool: {c['name']}")
+                lines.append(f"    using tool: {c['name']}\n")
+        sys.stdout.write("".join(lines))
+        sys.stdout.flush()
 
 
-async def main():
-    url = f"https://{os.environ.get('DBT_HOST')}/api/ai/v1/mcp/"
-    headers = {
-        "x-dbt-user-id": os.environ.get("DBT_USER_ID"),
-        "x-dbt-prod-environment-id": os.environ.get("DBT_PROD_ENV_ID"),
-        "x-dbt-dev-environment-id": os.environ.get("DBT_DEV_ENV_ID"),
-        "Authorization": f"token {os.environ.get('DBT_TOKEN')}",
-    }
+def _import_agent_modules():
+    # These imports are slow, so they run off the event loop
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.prebuilt import create_react_agent
+
+    return MultiServerMCPClient, InMemorySaver, create_react_agent
+
+
+async def create_agent(url, headers):
+    (
+        MultiServerMCPClient,
+        InMemorySaver,
+        create_react_agent,
+    ) = await asyncio.to_thread(_import_agent_modules)
     client = MultiServerMCPClient(
         {
             "dbt": {
@@ -45,17 +61,34 @@ async def main():
             }
         }
     )
-    tools = await client.get_tools()
-    agent = create_react_agent(
+    return create_react_agent(
         model="anthropic:claude-3-7-sonnet-latest",
-        tools=tools,
+        tools=await client.get_tools(),
         # This allows the agent to have conversational memory.
         checkpointer=InMemorySaver(),
     )
+
+
+async def main():
+    missing = [name for name in REQUIRED_ENV_VARS if not os.environ.get(name)]
+    if missing:
+        print(f"Missing environment variables: {', '.join(missing)}")
+        return
+
+    url = f"https://{os.environ['DBT_HOST']}/api/ai/v1/mcp/"
+    headers = {
+        "x-dbt-user-id": os.environ["DBT_USER_ID"],
+        "x-dbt-prod-environment-id": os.environ["DBT_PROD_ENV_ID"],
+        "x-dbt-dev-environment-id": os.environ["DBT_DEV_ENV_ID"],
+        "Authorization": f"token {os.environ['DBT_TOKEN']}",
+    }
+    # Set up the agent while the user types their first message
+    agent_task = asyncio.create_task(create_agent(url, headers))
     # This config maintains the conversation thread.
     config = {"configurable": {"thread_id": "1"}}
     while True:
-        user_input = input("User > ")
+        user_input = await asyncio.to_thread(input, "User > ")
+        agent = await agent_task
         async for item in agent.astream(
             {"messages": {"role": "user", "content": user_input}},
             config,
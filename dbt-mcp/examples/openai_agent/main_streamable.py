@@ -10,20 +10,21 @@ from agents.stream_events import RawResponsesStreamEvent, RunItemStreamEvent
 from openai.types.responses import ResponseCompletedEvent, ResponseOutputMessage
 
 
-def print_tool_call(tool_name, params, color="yellow", show_params=True):
-    # Define color codes for different colors
-    # we could use a library like colorama but this avoids adding a dependency
-    color_codes = {
-        "grey": "\033[37m",
-        "yellow": "\033[93m",
-    }
-    color_code_reset = "\033[0m"
+# Define color codes for different colors
+# we could use a library like colorama but this avoids adding a dependency
+COLOR_CODES = {
+    "grey": "\033[37m",
+    "yellow": "\033[93m",
+}
+COLOR_CODE_RESET = "\033[0m"
+
 
-    color_code = color_codes.get(color, color_codes["yellow"])
+def print_tool_call(tool_name, params, color="yellow", show_params=True):
+    color_code = COLOR_CODES.get(color, COLOR_CODES["yellow"])
     msg = f"Calling the tool {tool_name}"
     if show_params:
         msg += f" with params {params}"
-    print(f"{color_code}# {msg}{color_code_reset}")
+    print(f"{color_code}# {msg}{COLOR_CODE_RESET}")
 
 
 def handle_event_printing(event, show_tools_calls=True):
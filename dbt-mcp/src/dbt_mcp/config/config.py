@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import cache
 
 from dbt_mcp.config.config_providers import (
     DefaultAdminApiConfigProvider,
@@ -17,7 +18,7 @@ from dbt_mcp.dbt_cli.binary_type import BinaryType, detect_binary_type
 from dbt_mcp.tools.tool_names import ToolName
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackingConfig:
     host: str | None = None
     host_prefix: str | None = None
@@ -28,7 +29,7 @@ class TrackingConfig:
     usage_tracking_enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DbtCliConfig:
     project_dir: str
     dbt_path: str
@@ -36,7 +37,7 @@ class DbtCliConfig:
     binary_type: BinaryType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     tracking_config: TrackingConfig
     disable_tools: list[ToolName]
@@ -47,6 +48,9 @@ class Config:
     admin_api_config_provider: DefaultAdminApiConfigProvider | None
 
 
+# Settings come from the process environment, so the config is built once and
+# shared by every caller. Call load_config.cache_clear() after changing the env.
+@cache
 def load_config() -> Config:
     settings = DbtMcpSettings()  # type: ignore
     credentials_provider = CredentialsProvider(settings)
@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
@@ -8,10 +9,11 @@ from dbt_mcp.config.headers import (
     SemanticLayerHeadersProvider,
     SqlHeadersProvider,
 )
-from dbt_mcp.config.settings import CredentialsProvider
+from dbt_mcp.config.settings import CredentialsProvider, DbtMcpSettings
+from dbt_mcp.oauth.token_provider import TokenProvider
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticLayerConfig:
     url: str
     host: str
@@ -20,14 +22,14 @@ class SemanticLayerConfig:
     headers_provider: HeadersProvider
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscoveryConfig:
     url: str
     headers_provider: HeadersProvider
     environment_id: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AdminApiConfig:
     url: str
     headers_provider: HeadersProvider
@@ -35,7 +37,7 @@ class AdminApiConfig:
     prod_environment_id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SqlConfig:
     user_id: int
     dev_environment_id: int
@@ -49,32 +51,52 @@ class ConfigProvider[ConfigType](ABC):
     async def get_config(self) -> ConfigType: ...
 
 
-class DefaultSemanticLayerConfigProvider(ConfigProvider[SemanticLayerConfig]):
+class CredentialsConfigProvider[ConfigType](ConfigProvider[ConfigType]):
+    """Builds a config from resolved credentials once and reuses it."""
+
     def __init__(self, credentials_provider: CredentialsProvider):
         self.credentials_provider = credentials_provider
+        self._config: ConfigType | None = None
+        self._lock = asyncio.Lock()
 
-    async def get_config(self) -> SemanticLayerConfig:
-        settings, token_provider = await self.credentials_provider.get_credentials()
-        assert (
-            settings.actual_host
-            and settings.actual_prod_environment_id
-            and settings.dbt_token
-        )
-        is_local = settings.actual_host and settings.actual_host.startswith("localhost")
+    @abstractmethod
+    def build_config(
+        self, settings: DbtMcpSettings, token_provider: TokenProvider
+    ) -> ConfigType: ...
+
+    async def get_config(self) -> ConfigType:
+        if self._config is not None:
+            return self._config
+        # Concurrent first callers wait for a single build
+        async with self._lock:
+            if self._config is None:
+                credentials = await self.credentials_provider.get_credentials()
+                self._config = self.build_config(*credentials)
+            return self._config
+
+
+class DefaultSemanticLayerConfigProvider(
+    CredentialsConfigProvider[SemanticLayerConfig]
+):
+    def build_config(
+        self, settings: DbtMcpSettings, token_provider: TokenProvider
+    ) -> SemanticLayerConfig:
+        actual_host = settings.actual_host
+        host_prefix = settings.actual_host_prefix
+        prod_environment_id = settings.actual_prod_environment_id
+        assert actual_host and prod_environment_id and settings.dbt_token
+        is_local = actual_host.startswith("localhost")
         if is_local:
-            host = settings.actual_host
-        elif settings.actual_host_prefix:
-            host = (
-                f"{settings.actual_host_prefix}.semantic-layer.{settings.actual_host}"
-            )
+            host = actual_host
+        elif host_prefix:
+            host = f"{host_prefix}.semantic-layer.{actual_host}"
         else:
-            host = f"semantic-layer.{settings.actual_host}"
-        assert host is not None
+            host = f"semantic-layer.{actual_host}"
 
         return SemanticLayerConfig(
             url=f"http://{host}" if is_local else f"https://{host}" + "/api/graphql",
             host=host,
-            prod_environment_id=settings.actual_prod_environment_id,
+            prod_environment_id=prod_environment_id,
             token=settings.dbt_token,
             headers_provider=SemanticLayerHeadersProvider(
                 token_provider=token_provider
@@ -82,40 +104,37 @@ class DefaultSemanticLayerConfigProvider(ConfigProvider[SemanticLayerConfig]):
         )
 
 
-class DefaultDiscoveryConfigProvider(ConfigProvider[DiscoveryConfig]):
-    def __init__(self, credentials_provider: CredentialsProvider):
-        self.credentials_provider = credentials_provider
-
-    async def get_config(self) -> DiscoveryConfig:
-        settings, token_provider = await self.credentials_provider.get_credentials()
-        assert (
-            settings.actual_host
-            and settings.actual_prod_environment_id
-            and settings.dbt_token
-        )
-        if settings.actual_host_prefix:
-            url = f"https://{settings.actual_host_prefix}.metadata.{settings.actual_host}/graphql"
+class DefaultDiscoveryConfigProvider(CredentialsConfigProvider[DiscoveryConfig]):
+    def build_config(
+        self, settings: DbtMcpSettings, token_provider: TokenProvider
+    ) -> DiscoveryConfig:
+        actual_host = settings.actual_host
+        host_prefix = settings.actual_host_prefix
+        prod_environment_id = settings.actual_prod_environment_id
+        assert actual_host and prod_environment_id and settings.dbt_token
+        if host_prefix:
+            url = f"https://{host_prefix}.metadata.{actual_host}/graphql"
         else:
-            url = f"https://metadata.{settings.actual_host}/graphql"
+            url = f"https://metadata.{actual_host}/graphql"
 
         return DiscoveryConfig(
             url=url,
             headers_provider=DiscoveryHeadersProvider(token_provider=token_provider),
-            environment_id=settings.actual_prod_environment_id,
+            environment_id=prod_environment_id,
         )
 
 
-class DefaultAdminApiConfigProvider(ConfigProvider[AdminApiConfig]):
-    def __init__(self, credentials_provider: CredentialsProvider):
-        self.credentials_provider = credentials_provider
-
-    async def get_config(self) -> AdminApiConfig:
-        settings, token_provider = await self.credentials_provider.get_credentials()
-        assert settings.dbt_token and settings.actual_host and settings.dbt_account_id
-        if settings.actual_host_prefix:
-            url = f"https://{settings.actual_host_prefix}.{settings.actual_host}"
+class DefaultAdminApiConfigProvider(CredentialsConfigProvider[AdminApiConfig]):
+    def build_config(
+        self, settings: DbtMcpSettings, token_provider: TokenProvider
+    ) -> AdminApiConfig:
+        actual_host = settings.actual_host
+        host_prefix = settings.actual_host_prefix
+        assert settings.dbt_token and actual_host and settings.dbt_account_id
+        if host_prefix:
+            url = f"https://{host_prefix}.{actual_host}"
         else:
-            url = f"https://{settings.actual_host}"
+            url = f"https://{actual_host}"
 
         return AdminApiConfig(
             url=url,
@@ -125,31 +144,38 @@ class DefaultAdminApiConfigProvider(ConfigProvider[AdminApiConfig]):
         )
 
 
-class DefaultSqlConfigProvider(ConfigProvider[SqlConfig]):
-    def __init__(self, credentials_provider: CredentialsProvider):
-        self.credentials_provider = credentials_provider
+# Keyed by (is_local, has_host_prefix)
+_SQL_URL_TEMPLATES = {
+    (True, True): "http://{prefix}.{host}/v1/mcp/",
+    (True, False): "http://{host}/v1/mcp/",
+    (False, True): "https://{prefix}.{host}/api/ai/v1/mcp/",
+    (False, False): "https://{host}/api/ai/v1/mcp/",
+}
+
 
-    async def get_config(self) -> SqlConfig:
-        settings, token_provider = await self.credentials_provider.get_credentials()
+class DefaultSqlConfigProvider(CredentialsConfigProvider[SqlConfig]):
+    def build_config(
+        self, settings: DbtMcpSettings, token_provider: TokenProvider
+    ) -> SqlConfig:
+        actual_host = settings.actual_host
+        actual_host_prefix = settings.actual_host_prefix
+        prod_environment_id = settings.actual_prod_environment_id
         assert (
             settings.dbt_user_id
             and settings.dbt_token
             and settings.dbt_dev_env_id
-            and settings.actual_prod_environment_id
-            and settings.actual_host
+            and prod_environment_id
+            and actual_host
         )
-        is_local = settings.actual_host and settings.actual_host.startswith("localhost")
-        path = "/v1/mcp/" if is_local else "/api/ai/v1/mcp/"
-        scheme = "http://" if is_local else "https://"
-        host_prefix = (
-            f"{settings.actual_host_prefix}." if settings.actual_host_prefix else ""
-        )
-        url = f"{scheme}{host_prefix}{settings.actual_host}{path}"
+        url_template = _SQL_URL_TEMPLATES[
+            (actual_host.startswith("localhost"), bool(actual_host_prefix))
+        ]
+        url = url_template.format(prefix=actual_host_prefix, host=actual_host)
 
         return SqlConfig(
             user_id=settings.dbt_user_id,
             dev_environment_id=settings.dbt_dev_env_id,
-            prod_environment_id=settings.actual_prod_environment_id,
+            prod_environment_id=prod_environment_id,
             url=url,
             headers_provider=SqlHeadersProvider(token_provider=token_provider),
         )
@@ -1,3 +1,5 @@
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -9,3 +11,13 @@ class DbtProjectFlags(BaseModel):
 class DbtProjectYaml(BaseModel):
     model_config = ConfigDict(extra="allow")
     flags: None | DbtProjectFlags = None
+
+    @classmethod
+    def from_raw(cls, data: dict[str, Any]) -> "DbtProjectYaml":
+        # Only `flags` is read, so skip validating the rest of the project file
+        flags = data.get("flags")
+        return cls.model_construct(
+            flags=DbtProjectFlags.model_validate(flags)
+            if isinstance(flags, dict)
+            else None
+        )
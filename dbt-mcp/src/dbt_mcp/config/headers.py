@@ -11,12 +11,20 @@ class HeadersProvider(Protocol):
 class TokenHeadersProvider(ABC):
     def __init__(self, token_provider: TokenProvider):
         self.token_provider = token_provider
+        self._token: str | None = None
+        self._headers: dict[str, str] = {}
 
     @abstractmethod
     def headers_from_token(self, token: str) -> dict[str, str]: ...
 
     def get_headers(self) -> dict[str, str]:
-        return self.headers_from_token(self.token_provider.get_token())
+        # The headers are rebuilt only when the token changes (e.g. after an
+        # OAuth refresh). Callers merge or copy them and must not mutate them.
+        token = self.token_provider.get_token()
+        if token != self._token:
+            self._headers = self.headers_from_token(token)
+            self._token = token
+        return self._headers
 
 
 class AdminApiHeadersProvider(TokenHeadersProvider):
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
+import asyncio
 import os
 import socket
 import time
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, TypeGuard
 
-from filelock import FileLock
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
@@ -13,18 +15,18 @@ from dbt_mcp.config.headers import (
     TokenProvider,
 )
 from dbt_mcp.config.yaml import try_read_yaml
-from dbt_mcp.oauth.context_manager import DbtPlatformContextManager
-from dbt_mcp.oauth.dbt_platform import DbtPlatformContext
-from dbt_mcp.oauth.login import login
-from dbt_mcp.oauth.token_provider import (
-    OAuthTokenProvider,
-    StaticTokenProvider,
-)
+from dbt_mcp.oauth.token_provider import StaticTokenProvider
 from dbt_mcp.tools.tool_names import ToolName
 
+if TYPE_CHECKING:
+    from dbt_mcp.oauth.context_manager import DbtPlatformContextManager
+    from dbt_mcp.oauth.dbt_platform import DbtPlatformContext
+
 OAUTH_REDIRECT_STARTING_PORT = 6785
 DEFAULT_DBT_CLI_TIMEOUT = 60
 
+_TOOL_NAMES_BY_VALUE = {tool_name.value: tool_name for tool_name in ToolName}
+
 
 class DbtMcpSettings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -50,7 +52,7 @@ class DbtMcpSettings(BaseSettings):
     # dbt CLI settings
     dbt_project_dir: str | None = Field(None, alias="DBT_PROJECT_DIR")
     dbt_path: str = Field("dbt", alias="DBT_PATH")
-    dbt_cli_timeout: int = Field(DEFAULT_DBT_CLI_TIMEOUT, alias="DBT_CLI_TIMEOUT")
+    dbt_cli_timeout: int = Field(DEFAULT_DBT_CLI_TIMEOUT, alias="DBT_CLI_TIMEOUT", gt=0)
     dbt_warn_error_options: str | None = Field(None, alias="DBT_WARN_ERROR_OPTIONS")
     dbt_profiles_dir: str | None = Field(None, alias="DBT_PROFILES_DIR")
 
@@ -105,7 +107,7 @@ class DbtMcpSettings(BaseSettings):
         dbt_project_yml = try_read_yaml(Path(self.dbt_project_dir) / "dbt_project.yml")
         if dbt_project_yml is None:
             return None
-        return DbtProjectYaml.model_validate(dbt_project_yml)
+        return DbtProjectYaml.from_raw(dbt_project_yml)
 
     @property
     def usage_tracking_enabled(self) -> bool:
@@ -141,13 +143,14 @@ class DbtMcpSettings(BaseSettings):
             tool_name_stripped = tool_name.strip()
             if tool_name_stripped == "":
                 continue
-            try:
-                tool_names.append(ToolName(tool_name_stripped))
-            except ValueError:
+            tool = _TOOL_NAMES_BY_VALUE.get(tool_name_stripped)
+            if tool is None:
                 errors.append(
                     f"Invalid tool name in DISABLE_TOOLS: {tool_name_stripped}."
                     + " Must be a valid tool name."
                 )
+            else:
+                tool_names.append(tool)
         if errors:
             raise ValueError("\n".join(errors))
         return tool_names
@@ -181,27 +184,45 @@ def get_dbt_profiles_path(dbt_profiles_dir: str | None = None) -> Path:
         return Path.home() / ".dbt"
 
 
+def _is_fresh_dbt_platform_context(
+    dbt_ctx: DbtPlatformContext | None,
+) -> TypeGuard[DbtPlatformContext]:
+    return bool(
+        dbt_ctx
+        and dbt_ctx.account_id
+        and dbt_ctx.host_prefix
+        and dbt_ctx.dev_environment
+        and dbt_ctx.prod_environment
+        and dbt_ctx.decoded_access_token
+        and dbt_ctx.decoded_access_token.access_token_response.expires_at
+        > time.time() + 120  # 2 minutes buffer
+    )
+
+
 async def get_dbt_platform_context(
     *,
     dbt_user_dir: Path,
     dbt_platform_url: str,
     dbt_platform_context_manager: DbtPlatformContextManager,
 ) -> DbtPlatformContext:
+    # A fresh context only needs reading, so skip the lock in the common case
+    dbt_ctx = dbt_platform_context_manager.read_context()
+    if _is_fresh_dbt_platform_context(dbt_ctx):
+        return dbt_ctx
+
+    # filelock is only needed for the OAuth flow, so only import it when needed
+    from filelock import FileLock
+
     # Some MCP hosts (Claude Desktop) tend to run multiple MCP servers instances.
     # We need to lock so that only one can run the oauth flow.
     with FileLock(dbt_user_dir / "mcp.lock"):
+        # Another instance may have logged in while we waited for the lock
         dbt_ctx = dbt_platform_context_manager.read_context()
-        if (
-            dbt_ctx
-            and dbt_ctx.account_id
-            and dbt_ctx.host_prefix
-            and dbt_ctx.dev_environment
-            and dbt_ctx.prod_environment
-            and dbt_ctx.decoded_access_token
-            and dbt_ctx.decoded_access_token.access_token_response.expires_at
-            > time.time() + 120  # 2 minutes buffer
-        ):
+        if _is_fresh_dbt_platform_context(dbt_ctx):
             return dbt_ctx
+        # The login flow pulls in fastapi and uvicorn, so only import it when needed
+        from dbt_mcp.oauth.login import login
+
         # Find an available port for the local OAuth redirect server
         selected_port = _find_available_port(start_port=OAUTH_REDIRECT_STARTING_PORT)
         return await login(
@@ -228,9 +249,12 @@ def get_dbt_host(
 
 
 def validate_settings(settings: DbtMcpSettings):
-    errors: list[str] = []
-    errors.extend(validate_dbt_platform_settings(settings))
-    errors.extend(validate_dbt_cli_settings(settings))
+    _raise_for_errors(
+        validate_dbt_platform_settings(settings) + validate_dbt_cli_settings(settings)
+    )
+
+
+def _raise_for_errors(errors: list[str]) -> None:
     if errors:
         raise ValueError("Errors found in configuration:\n\n" + "\n".join(errors))
 
@@ -239,17 +263,21 @@ def validate_dbt_platform_settings(
     settings: DbtMcpSettings,
 ) -> list[str]:
     errors: list[str] = []
+    actual_host = settings.actual_host
+    prod_environment_id = settings.actual_prod_environment_id
+    disable_sql = settings.actual_disable_sql
+    disable_tools = frozenset(settings.disable_tools or ())
     if (
         not settings.disable_semantic_layer
         or not settings.disable_discovery
-        or not settings.actual_disable_sql
+        or not disable_sql
         or not settings.disable_admin_api
     ):
-        if not settings.actual_host:
+        if not actual_host:
             errors.append(
                 "DBT_HOST environment variable is required when semantic layer, discovery, SQL or admin API tools are enabled."
             )
-        if not settings.actual_prod_environment_id:
+        if not prod_environment_id:
             errors.append(
                 "DBT_PROD_ENV_ID environment variable is required when semantic layer, discovery, SQL or admin API tools are enabled."
             )
@@ -257,24 +285,19 @@ def validate_dbt_platform_settings(
             errors.append(
                 "DBT_TOKEN environment variable is required when semantic layer, discovery, SQL or admin API tools are enabled."
             )
-        if settings.actual_host and (
-            settings.actual_host.startswith("metadata")
-            or settings.actual_host.startswith("semantic-layer")
-        ):
+        if actual_host and actual_host.startswith(("metadata", "semantic-layer")):
             errors.append(
                 "DBT_HOST must not start with 'metadata' or 'semantic-layer'."
             )
     if (
-        not settings.actual_disable_sql
-        and ToolName.TEXT_TO_SQL not in (settings.disable_tools or [])
-        and not settings.actual_prod_environment_id
+        not disable_sql
+        and ToolName.TEXT_TO_SQL not in disable_tools
+        and not prod_environment_id
     ):
         errors.append(
             "DBT_PROD_ENV_ID environment variable is required when text_to_sql is enabled."
         )
-    if not settings.actual_disable_sql and ToolName.EXECUTE_SQL not in (
-        settings.disable_tools or []
-    ):
+    if not disable_sql and ToolName.EXECUTE_SQL not in disable_tools:
         if not settings.dbt_dev_env_id:
             errors.append(
                 "DBT_DEV_ENV_ID environment variable is required when execute_sql is enabled."
@@ -304,17 +327,29 @@ class CredentialsProvider:
     def __init__(self, settings: DbtMcpSettings):
         self.settings = settings
         self.token_provider: TokenProvider | None = None
+        self._lock = asyncio.Lock()
 
     async def get_credentials(self) -> tuple[DbtMcpSettings, TokenProvider]:
         if self.token_provider is not None:
             # If token provider is already set, just return the cached values
             return self.settings, self.token_provider
+        # Concurrent first callers share a single resolution (and OAuth flow)
+        async with self._lock:
+            if self.token_provider is not None:
+                return self.settings, self.token_provider
+            return await self._resolve_credentials()
+
+    async def _resolve_credentials(self) -> tuple[DbtMcpSettings, TokenProvider]:
         # Load settings from environment variables using pydantic_settings
         dbt_platform_errors = validate_dbt_platform_settings(self.settings)
         # Oauth is exerimental but secure, so you shouldn't use it,
         # but there are no security concerns if you do.
         enable_oauth = os.environ.get("ENABLE_EXPERIMENAL_SECURE_OAUTH") == "true"
         if enable_oauth and dbt_platform_errors:
+            # OAuthTokenProvider pulls in authlib, so only import the OAuth helpers here
+            from dbt_mcp.oauth.context_manager import DbtPlatformContextManager
+            from dbt_mcp.oauth.token_provider import OAuthTokenProvider
+
             dbt_user_dir = get_dbt_profiles_path(
                 dbt_profiles_dir=self.settings.dbt_profiles_dir
             )
@@ -354,5 +389,8 @@ class CredentialsProvider:
             validate_settings(self.settings)
             return self.settings, self.token_provider
         self.token_provider = StaticTokenProvider(token=self.settings.dbt_token)
-        validate_settings(self.settings)
+        # The settings are unchanged since the platform check above
+        _raise_for_errors(
+            dbt_platform_errors + validate_dbt_cli_settings(self.settings)
+        )
         return self.settings, self.token_provider
@@ -2,18 +2,38 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+_ALTERNATE_SUFFIXES = {".yml": ".yaml", ".yaml": ".yml"}
+
+# Parsed YAML keyed by path, invalidated when the file's mtime or size changes.
+_CACHE: dict[Path, tuple[int, int, dict | None]] = {}
+
+
+def _read_yaml_cached(file_path: Path) -> dict | None:
+    stat = file_path.stat()
+    cached = _CACHE.get(file_path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    data = yaml.load(file_path.read_bytes(), Loader=SafeLoader)
+    _CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
 
 def try_read_yaml(file_path: Path) -> dict | None:
     try:
-        suffix = file_path.suffix.lower()
-        if suffix not in {".yml", ".yaml"}:
+        alternate_suffix = _ALTERNATE_SUFFIXES.get(file_path.suffix.lower())
+        if alternate_suffix is None:
             return None
-        alternate_suffix = ".yaml" if suffix == ".yml" else ".yml"
         alternate_path = file_path.with_suffix(alternate_suffix)
-        if file_path.exists():
-            return yaml.safe_load(file_path.read_text())
-        if alternate_path.exists():
-            return yaml.safe_load(alternate_path.read_text())
+        for path in (file_path, alternate_path):
+            try:
+                return _read_yaml_cached(path)
+            except FileNotFoundError:
+                continue
     except Exception:
         return None
     return None
@@ -1,5 +1,5 @@
+import asyncio
 import logging
-from functools import cache
 from typing import Any
 
 import requests
@@ -11,6 +11,40 @@ from dbt_mcp.config.config_providers import (
 
 logger = logging.getLogger(__name__)
 
+# Artifact path prefixes hidden by list_job_run_artifacts
+_SKIPPED_ARTIFACT_PREFIXES = ("compiled/", "run/")
+
+# Run fields dropped by list_jobs_runs
+_RUN_FIELDS_TO_DROP = frozenset(
+    {
+        "job",
+        "account_id",
+        "environment_id",
+        "blocked_by",
+        "used_repo_cache",
+        "audit",
+        "created_at_humanized",
+        "duration_humanized",
+        "finished_at_humanized",
+        "queued_duration_humanized",
+        "run_duration_humanized",
+        "artifacts_saved",
+        "artifact_s3_path",
+        "has_docs_generated",
+        "has_sources_generated",
+        "notifications_sent",
+        "executed_by_thread_id",
+        "updated_at",
+        "dequeued_at",
+        "last_checked_at",
+        "last_heartbeat_at",
+        "trigger",
+        "run_steps",
+        "deprecation",
+        "environment",
+    }
+)
+
 
 class AdminAPIError(Exception):
     """Exception raised for Admin API errors."""
@@ -23,6 +57,9 @@ class DbtAdminAPIClient:
 
     def __init__(self, config_provider: ConfigProvider[AdminApiConfig]):
         self.config_provider = config_provider
+        # Reuse connections across calls instead of a new TLS handshake each time.
+        # requests is blocking, so calls are made off the event loop.
+        self._session = requests.Session()
 
     async def get_config(self) -> AdminApiConfig:
         return await self.config_provider.get_config()
@@ -43,14 +80,15 @@ class DbtAdminAPIClient:
         headers = await self.get_headers()
 
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
+            response = await asyncio.to_thread(
+                self._session.request, method, url, headers=headers, **kwargs
+            )
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
             raise AdminAPIError(f"API request failed: {e}")
 
-    @cache
     async def list_jobs(self, account_id: int, **params) -> list[dict[str, Any]]:
         """List jobs for an account."""
         result = await self._make_request(
@@ -62,59 +100,37 @@ class DbtAdminAPIClient:
 
         # we filter the data to the most relevant fields
         # the rest of the fields can be retrieved with the get_job tool
-        filtered_data = [
-            {
-                "id": job.get("id"),
-                "name": job.get("name"),
-                "description": job.get("description"),
-                "dbt_version": job.get("dbt_version"),
-                "job_type": job.get("job_type"),
-                "triggers": job.get("triggers"),
-                "most_recent_run_id": job.get("most_recent_run").get("id")
-                if job.get("most_recent_run")
-                else None,
-                "most_recent_run_status": job.get("most_recent_run").get(
-                    "status_humanized"
-                )
-                if job.get("most_recent_run")
-                else None,
-                "most_recent_run_started_at": job.get("most_recent_run").get(
-                    "started_at"
-                )
-                if job.get("most_recent_run")
-                else None,
-                "most_recent_run_finished_at": job.get("most_recent_run").get(
-                    "finished_at"
-                )
-                if job.get("most_recent_run")
-                else None,
-                "most_recent_completed_run_id": job.get(
-                    "most_recent_completed_run"
-                ).get("id")
-                if job.get("most_recent_completed_run")
-                else None,
-                "most_recent_completed_run_status": job.get(
-                    "most_recent_completed_run"
-                ).get("status_humanized")
-                if job.get("most_recent_completed_run")
-                else None,
-                "most_recent_completed_run_started_at": job.get(
-                    "most_recent_completed_run"
-                ).get("started_at")
-                if job.get("most_recent_completed_run")
-                else None,
-                "most_recent_completed_run_finished_at": job.get(
-                    "most_recent_completed_run"
-                ).get("finished_at")
-                if job.get("most_recent_completed_run")
-                else None,
-                "schedule": job.get("schedule").get("cron")
-                if job.get("schedule")
-                else None,
-                "next_run": job.get("next_run"),
-            }
-            for job in data
-        ]
+        filtered_data = []
+        for job in data:
+            recent_run = job.get("most_recent_run") or {}
+            completed_run = job.get("most_recent_completed_run") or {}
+            schedule = job.get("schedule") or {}
+            filtered_data.append(
+                {
+                    "id": job.get("id"),
+                    "name": job.get("name"),
+                    "description": job.get("description"),
+                    "dbt_version": job.get("dbt_version"),
+                    "job_type": job.get("job_type"),
+                    "triggers": job.get("triggers"),
+                    "most_recent_run_id": recent_run.get("id"),
+                    "most_recent_run_status": recent_run.get("status_humanized"),
+                    "most_recent_run_started_at": recent_run.get("started_at"),
+                    "most_recent_run_finished_at": recent_run.get("finished_at"),
+                    "most_recent_completed_run_id": completed_run.get("id"),
+                    "most_recent_completed_run_status": completed_run.get(
+                        "status_humanized"
+                    ),
+                    "most_recent_completed_run_started_at": completed_run.get(
+                        "started_at"
+                    ),
+                    "most_recent_completed_run_finished_at": completed_run.get(
+                        "finished_at"
+                    ),
+                    "schedule": schedule.get("cron"),
+                    "next_run": job.get("next_run"),
+                }
+            )
 
         return filtered_data
 
@@ -147,33 +163,11 @@ class DbtAdminAPIClient:
 
         # we remove less relevant fields from the data we get to avoid filling the context with too much data
         for run in data:
-            run["job_name"] = run.get("job", {}).get("name", "")
-            run["job_steps"] = run.get("job", {}).get("execute_step", "")
-            run.pop("job", None)
-            run.pop("account_id", None)
-            run.pop("environment_id", None)
-            run.pop("blocked_by", None)
-            run.pop("used_repo_cache", None)
-            run.pop("audit", None)
-            run.pop("created_at_humanized", None)
-            run.pop("duration_humanized", None)
-            run.pop("finished_at_humanized", None)
-            run.pop("queued_duration_humanized", None)
-            run.pop("run_duration_humanized", None)
-            run.pop("artifacts_saved", None)
-            run.pop("artifact_s3_path", None)
-            run.pop("has_docs_generated", None)
-            run.pop("has_sources_generated", None)
-            run.pop("notifications_sent", None)
-            run.pop("executed_by_thread_id", None)
-            run.pop("updated_at", None)
-            run.pop("dequeued_at", None)
-            run.pop("last_checked_at", None)
-            run.pop("last_heartbeat_at", None)
-            run.pop("trigger", None)
-            run.pop("run_steps", None)
-            run.pop("deprecation", None)
-            run.pop("environment", None)
+            job = run.get("job") or {}
+            run["job_name"] = job.get("name", "")
+            run["job_steps"] = job.get("execute_step", "")
+            for key in _RUN_FIELDS_TO_DROP & run.keys():
+                del run[key]
 
         return data
 
@@ -218,9 +212,7 @@ class DbtAdminAPIClient:
         filtered_data = [
             artifact
             for artifact in data
-            if (
-                not artifact.startswith("compiled/") and not artifact.startswith("run/")
-            )
+            if not artifact.startswith(_SKIPPED_ARTIFACT_PREFIXES)
         ]
         return filtered_data
 
@@ -241,7 +233,8 @@ class DbtAdminAPIClient:
             "Accept": "*/*",
         } | config.headers_provider.get_headers()
 
-        response = requests.get(
+        response = await asyncio.to_thread(
+            self._session.get,
             f"{config.url}/api/v2/accounts/{account_id}/runs/{run_id}/artifacts/{artifact_path}",
             headers=get_artifact_header,
             params=params,
@@ -1,5 +1,8 @@
+import os
+import shutil
 import subprocess
 from enum import Enum
+from functools import lru_cache
 
 
 class BinaryType(Enum):
@@ -12,6 +15,9 @@ def detect_binary_type(file_path: str) -> BinaryType:
     """
     Detect the type of dbt binary (dbt Core, Fusion, or dbt Cloud CLI) by running --help.
 
+    The result is cached per path until the binary's mtime or size changes, so an
+    unchanged binary is only executed once.
+
     Args:
         file_path: Path to the dbt executable
 
@@ -21,6 +27,21 @@ def detect_binary_type(file_path: str) -> BinaryType:
     Raises:
         Exception: If the binary cannot be executed or accessed
     """
+    # Resolves bare names on PATH and checks absolute paths are executable,
+    # so a bad DBT_PATH fails without spawning a process
+    resolved_path = shutil.which(file_path)
+    if resolved_path is None:
+        raise Exception(
+            f"Cannot execute binary {file_path}: not found or not executable"
+        )
+    stat = os.stat(resolved_path)
+    return _detect_binary_type(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+# mtime_ns and size are only part of the cache key, so reinstalling or
+# upgrading dbt in place is picked up without a restart
+@lru_cache(maxsize=8)
+def _detect_binary_type(file_path: str, mtime_ns: int, size: int) -> BinaryType:
     try:
         result = subprocess.run(
             [file_path, "--help"], capture_output=True, text=True, timeout=10
@@ -1,6 +1,8 @@
+import asyncio
 import os
 import subprocess
 from collections.abc import Iterable, Sequence
+from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
@@ -13,8 +15,23 @@ from dbt_mcp.tools.register import register_tools
 from dbt_mcp.tools.tool_names import ToolName
 from dbt_mcp.tools.annotations import create_tool_annotations
 
+# Commands that should always be quiet to reduce output verbosity
+VERBOSE_COMMANDS = frozenset(
+    {
+        "build",
+        "compile",
+        "docs",
+        "parse",
+        "run",
+        "test",
+        "list",
+    }
+)
+
 
 def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition]:
+    # Tools run this in a worker thread so a long dbt command doesn't block
+    # the event loop (and with it every other in-flight MCP request)
     def _run_dbt_command(
         command: list[str],
         selector: str | None = None,
@@ -24,17 +41,6 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
         vars: str | None = None,
     ) -> str:
         try:
-            # Commands that should always be quiet to reduce output verbosity
-            verbose_commands = [
-                "build",
-                "compile",
-                "docs",
-                "parse",
-                "run",
-                "test",
-                "list",
-            ]
-
             if is_full_refresh is True:
                 command.append("--full-refresh")
 
@@ -50,7 +56,7 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
 
             full_command = command.copy()
             # Add --quiet flag to specific commands to reduce context window usage
-            if len(full_command) > 0 and full_command[0] in verbose_commands:
+            if len(full_command) > 0 and full_command[0] in VERBOSE_COMMANDS:
                 main_command = full_command[0]
                 command_args = full_command[1:] if len(full_command) > 1 else []
                 full_command = [main_command, "--quiet", *command_args]
@@ -81,7 +87,7 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
                 else ""
             )
 
-    def build(
+    async def build(
         selector: str | None = Field(
             default=None, description=get_prompt("dbt_cli/args/selectors")
         ),
@@ -92,7 +98,8 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             default=None, description=get_prompt("dbt_cli/args/vars")
         ),
     ) -> str:
-        return _run_dbt_command(
+        return await asyncio.to_thread(
+            _run_dbt_command,
             ["build"],
             selector,
             is_selectable=True,
@@ -100,13 +107,13 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             vars=vars,
         )
 
-    def compile() -> str:
-        return _run_dbt_command(["compile"])
+    async def compile() -> str:
+        return await asyncio.to_thread(_run_dbt_command, ["compile"])
 
-    def docs() -> str:
-        return _run_dbt_command(["docs", "generate"])
+    async def docs() -> str:
+        return await asyncio.to_thread(_run_dbt_command, ["docs", "generate"])
 
-    def ls(
+    async def ls(
         selector: str | None = Field(
             default=None, description=get_prompt("dbt_cli/args/selectors")
         ),
@@ -115,17 +122,18 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             description=get_prompt("dbt_cli/args/resource_type"),
         ),
     ) -> str:
-        return _run_dbt_command(
+        return await asyncio.to_thread(
+            _run_dbt_command,
             ["list"],
             selector,
             resource_type=resource_type,
             is_selectable=True,
         )
 
-    def parse() -> str:
-        return _run_dbt_command(["parse"])
+    async def parse() -> str:
+        return await asyncio.to_thread(_run_dbt_command, ["parse"])
 
-    def run(
+    async def run(
         selector: str | None = Field(
             default=None, description=get_prompt("dbt_cli/args/selectors")
         ),
@@ -136,7 +144,8 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             default=None, description=get_prompt("dbt_cli/args/vars")
         ),
     ) -> str:
-        return _run_dbt_command(
+        return await asyncio.to_thread(
+            _run_dbt_command,
             ["run"],
             selector,
             is_selectable=True,
@@ -144,7 +153,7 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             vars=vars,
         )
 
-    def test(
+    async def test(
         selector: str | None = Field(
             default=None, description=get_prompt("dbt_cli/args/selectors")
         ),
@@ -152,9 +161,11 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
             default=None, description=get_prompt("dbt_cli/args/vars")
         ),
     ) -> str:
-        return _run_dbt_command(["test"], selector, is_selectable=True, vars=vars)
+        return await asyncio.to_thread(
+            _run_dbt_command, ["test"], selector, is_selectable=True, vars=vars
+        )
 
-    def show(
+    async def show(
         sql_query: str = Field(description=get_prompt("dbt_cli/args/sql_query")),
         limit: int = Field(default=5, description=get_prompt("dbt_cli/args/limit")),
     ) -> str:
@@ -174,29 +185,27 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
         if cli_limit is not None:
             args.extend(["--limit", str(cli_limit)])
         args.extend(["--output", "json"])
-        return _run_dbt_command(args)
+        return await asyncio.to_thread(_run_dbt_command, args)
 
     def read_file(
-        file_path: str = Field(description="Path to the file to read, relative to the dbt project directory")
+        file_path: str = Field(
+            description="Path to the file to read, relative to the dbt project directory"
+        ),
     ) -> str:
         """Read the contents of a file in the dbt project."""
-        import os
-        from pathlib import Path
-        
         # Get the full path relative to the project directory
         full_path = Path(config.project_dir) / file_path
-        
+
         try:
-            if not full_path.exists():
-                return f"Error: File not found: {file_path}"
-            
+            # A single stat covers the common case; only disambiguate on failure
             if not full_path.is_file():
-                return f"Error: Path is not a file: {file_path}"
-            
+                if full_path.exists():
+                    return f"Error: Path is not a file: {file_path}"
+                return f"Error: File not found: {file_path}"
+
             # Read the file content
-            content = full_path.read_text(encoding='utf-8')
-            return content
-            
+            return full_path.read_text(encoding="utf-8")
+
         except Exception as e:
             return f"Error reading file {file_path}: {str(e)}"
 
@@ -51,15 +51,10 @@ class DbtPlatformContextManager:
         self.write_context_to_file(next_dbt_platform_context)
         return next_dbt_platform_context
 
-    def _ensure_config_location_exists(self) -> None:
-        """Ensure the config file location and its parent directories exist."""
-        self.config_location.parent.mkdir(parents=True, exist_ok=True)
-        if not self.config_location.exists():
-            self.config_location.touch()
-
     def write_context_to_file(self, context: DbtPlatformContext) -> None:
         """Write context to file with proper locking."""
-        self._ensure_config_location_exists()
+        # write_text creates the file, so only the parent directory is ensured
+        self.config_location.parent.mkdir(parents=True, exist_ok=True)
         self.config_location.write_text(
             yaml.dump(context.model_dump(), default_flow_style=False)
         )
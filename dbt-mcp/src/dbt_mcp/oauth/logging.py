@@ -1,14 +1,14 @@
 import logging
 
+# uvicorn, fastapi, and related loggers
+_SERVER_LOGGERS = (
+    "uvicorn",
+    "uvicorn.error",
+    "uvicorn.access",
+    "fastapi",
+)
 
-def disable_server_logs() -> None:
-    # Disable uvicorn, fastapi, and related loggers
-    loggers = (
-        "uvicorn",
-        "uvicorn.error",
-        "uvicorn.access",
-        "fastapi",
-    )
 
-    for logger_name in loggers:
+def disable_server_logs() -> None:
+    for logger_name in _SERVER_LOGGERS:
         logging.getLogger(logger_name).disabled = True
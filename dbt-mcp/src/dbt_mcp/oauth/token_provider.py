@@ -2,8 +2,6 @@ import asyncio
 import logging
 from typing import Protocol
 
-from authlib.integrations.requests_client import OAuth2Session
-
 from dbt_mcp.oauth.client_id import OAUTH_CLIENT_ID
 from dbt_mcp.oauth.context_manager import DbtPlatformContextManager
 from dbt_mcp.oauth.dbt_platform import dbt_platform_context_from_token_response
@@ -34,6 +32,10 @@ class OAuthTokenProvider:
         self.dbt_platform_url = dbt_platform_url
         self.refresh_strategy = refresh_strategy or DefaultRefreshStrategy()
         self.token_url = f"{self.dbt_platform_url}/oauth/token"
+        # authlib is slow to import and only needed for OAuth, so only import it
+        # here rather than for every user of TokenProvider/StaticTokenProvider
+        from authlib.integrations.requests_client import OAuth2Session
+
         self.oauth_client = OAuth2Session(
             client_id=OAUTH_CLIENT_ID,
             token_endpoint=self.token_url,
@@ -0,0 +1,11 @@
+import pytest
+
+from dbt_mcp.config.config import load_config
+
+
+@pytest.fixture(autouse=True)
+def clear_load_config_cache():
+    # load_config is cached per process, but tests change the environment
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
@@ -1,3 +1,5 @@
+import asyncio
+
 from dbt_mcp.config.config import load_config
 from dbt_mcp.mcp.server import create_dbt_mcp
 from remote_mcp.session import session_context
@@ -8,12 +10,14 @@ async def test_remote_mcp_list_metrics_equals_local_mcp() -> None:
         config = load_config()
         dbt_mcp = await create_dbt_mcp(config)
 
-        remote_metrics = await session.call_tool(
-            name="list_metrics",
-            arguments={},
-        )
-        local_metrics = await dbt_mcp.call_tool(
-            name="list_metrics",
-            arguments={},
+        remote_metrics, local_metrics = await asyncio.gather(
+            session.call_tool(
+                name="list_metrics",
+                arguments={},
+            ),
+            dbt_mcp.call_tool(
+                name="list_metrics",
+                arguments={},
+            ),
         )
         assert remote_metrics.content == local_metrics
@@ -160,6 +160,14 @@ class TestDbtMcpSettings:
                 settings = DbtMcpSettings(_env_file=None)
                 assert settings.disable_tools == expected
 
+    def test_disable_tools_rejects_unknown_names(self):
+        with patch.dict(os.environ, {"DISABLE_TOOLS": "build,not_a_tool,nope"}):
+            with pytest.raises(ValueError) as exc_info:
+                DbtMcpSettings(_env_file=None)
+        message = str(exc_info.value)
+        assert "Invalid tool name in DISABLE_TOOLS: not_a_tool." in message
+        assert "Invalid tool name in DISABLE_TOOLS: nope." in message
+
     def test_actual_host_property(self):
         with patch.dict(os.environ, {"DBT_HOST": "host1.com"}):
             settings = DbtMcpSettings(_env_file=None)
@@ -232,6 +240,7 @@ class TestLoadConfig:
             with patch.dict(os.environ, env_vars, clear=True):
                 settings_instance = DbtMcpSettings(_env_file=None)
             mock_settings_class.return_value = settings_instance
+            load_config.cache_clear()
             return load_config()
 
     def test_valid_config_all_services_enabled(self):
@@ -288,6 +297,15 @@ class TestLoadConfig:
         with pytest.raises(ValueError):
             self._load_config_with_env(env_vars)
 
+    def test_non_positive_cli_timeout_is_rejected(self):
+        env_vars = {
+            "DBT_PROJECT_DIR": "/test/project",
+            "DBT_CLI_TIMEOUT": "0",
+        }
+
+        with pytest.raises(ValueError):
+            self._load_config_with_env(env_vars)
+
     def test_multicell_account_prefix_configurations(self):
         env_vars = {
             "DBT_HOST": "test.dbt.com",
@@ -320,6 +338,13 @@ class TestLoadConfig:
 
         assert config.semantic_layer_config_provider is not None
 
+    def test_load_config_is_cached(self):
+        with patch.dict(os.environ, {"DISABLE_DBT_CLI": "true"}, clear=True):
+            with patch("dbt_mcp.config.config.DbtMcpSettings") as mock_settings_class:
+                mock_settings_class.return_value = DbtMcpSettings(_env_file=None)
+                assert load_config() is load_config()
+                mock_settings_class.assert_called_once()
+
     def test_warn_error_options_default_setting(self):
         env_vars = {
             "DBT_TOKEN": "test_token",
@@ -0,0 +1,107 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from dbt_mcp.config.config_providers import (
+    DefaultDiscoveryConfigProvider,
+    DefaultSemanticLayerConfigProvider,
+    DefaultSqlConfigProvider,
+)
+from dbt_mcp.config.settings import CredentialsProvider, DbtMcpSettings
+from dbt_mcp.oauth.token_provider import StaticTokenProvider
+
+
+def _credentials_provider() -> CredentialsProvider:
+    settings = DbtMcpSettings.model_construct(
+        dbt_host="cloud.getdbt.com",
+        dbt_prod_env_id=1,
+        dbt_token="token",
+    )
+    credentials_provider = CredentialsProvider(settings)
+    credentials_provider.get_credentials = AsyncMock(  # type: ignore[method-assign]
+        return_value=(settings, StaticTokenProvider(token="token"))
+    )
+    return credentials_provider
+
+
+async def test_get_config_builds_config_once():
+    credentials_provider = _credentials_provider()
+    config_provider = DefaultDiscoveryConfigProvider(credentials_provider)
+
+    first = await config_provider.get_config()
+    second = await config_provider.get_config()
+
+    assert first is second
+    assert first.url == "https://metadata.cloud.getdbt.com/graphql"
+    credentials_provider.get_credentials.assert_awaited_once()
+
+
+async def test_get_config_concurrent_callers_share_build():
+    credentials_provider = _credentials_provider()
+    config_provider = DefaultDiscoveryConfigProvider(credentials_provider)
+
+    configs = await asyncio.gather(*(config_provider.get_config() for _ in range(5)))
+
+    assert all(config is configs[0] for config in configs)
+    credentials_provider.get_credentials.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "dbt_host, multicell_account_prefix, expected_url",
+    [
+        ("localhost:8000", "ab123", "http://ab123.localhost:8000/v1/mcp/"),
+        ("localhost:8000", None, "http://localhost:8000/v1/mcp/"),
+        ("us1.dbt.com", "ab123", "https://ab123.us1.dbt.com/api/ai/v1/mcp/"),
+        ("cloud.getdbt.com", None, "https://cloud.getdbt.com/api/ai/v1/mcp/"),
+    ],
+)
+def test_sql_config_url(dbt_host, multicell_account_prefix, expected_url):
+    settings = DbtMcpSettings.model_construct(
+        dbt_host=dbt_host,
+        multicell_account_prefix=multicell_account_prefix,
+        dbt_user_id=1,
+        dbt_dev_env_id=2,
+        dbt_prod_env_id=3,
+        dbt_token="token",
+    )
+    config = DefaultSqlConfigProvider(CredentialsProvider(settings)).build_config(
+        settings, StaticTokenProvider(token="token")
+    )
+
+    assert config.url == expected_url
+
+
+@pytest.mark.parametrize(
+    "dbt_host, multicell_account_prefix, expected_host, expected_url",
+    [
+        ("localhost:8000", None, "localhost:8000", "http://localhost:8000"),
+        (
+            "us1.dbt.com",
+            "ab123",
+            "ab123.semantic-layer.us1.dbt.com",
+            "https://ab123.semantic-layer.us1.dbt.com/api/graphql",
+        ),
+        (
+            "cloud.getdbt.com",
+            None,
+            "semantic-layer.cloud.getdbt.com",
+            "https://semantic-layer.cloud.getdbt.com/api/graphql",
+        ),
+    ],
+)
+def test_semantic_layer_config_host_and_url(
+    dbt_host, multicell_account_prefix, expected_host, expected_url
+):
+    settings = DbtMcpSettings.model_construct(
+        dbt_host=dbt_host,
+        multicell_account_prefix=multicell_account_prefix,
+        dbt_prod_env_id=3,
+        dbt_token="token",
+    )
+    config = DefaultSemanticLayerConfigProvider(
+        CredentialsProvider(settings)
+    ).build_config(settings, StaticTokenProvider(token="token"))
+
+    assert config.host == expected_host
+    assert config.url == expected_url
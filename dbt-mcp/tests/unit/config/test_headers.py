@@ -0,0 +1,20 @@
+from unittest.mock import Mock
+
+from dbt_mcp.config.headers import DiscoveryHeadersProvider
+
+
+def test_get_headers_rebuilds_only_when_token_changes():
+    token_provider = Mock()
+    token_provider.get_token.return_value = "first"
+    headers_provider = DiscoveryHeadersProvider(token_provider=token_provider)
+
+    first = headers_provider.get_headers()
+    assert headers_provider.get_headers() is first
+    assert first == {
+        "Authorization": "Bearer first",
+        "Content-Type": "application/json",
+    }
+
+    token_provider.get_token.return_value = "second"
+
+    assert headers_provider.get_headers()["Authorization"] == "Bearer second"
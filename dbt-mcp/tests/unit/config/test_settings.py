@@ -0,0 +1,164 @@
+import asyncio
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dbt_mcp.config.settings import (
+    CredentialsProvider,
+    DbtMcpSettings,
+    get_dbt_platform_context,
+    validate_dbt_platform_settings,
+)
+from dbt_mcp.oauth.dbt_platform import DbtPlatformContext, DbtPlatformEnvironment
+from dbt_mcp.oauth.token import AccessTokenResponse, DecodedAccessToken
+
+
+def _dbt_platform_context() -> DbtPlatformContext:
+    return DbtPlatformContext(
+        decoded_access_token=DecodedAccessToken(
+            access_token_response=AccessTokenResponse(
+                access_token="access_token",
+                refresh_token="refresh_token",
+                expires_in=3600,
+                scope="scope",
+                token_type="Bearer",
+                expires_at=int(time.time()) + 3600,
+            ),
+            decoded_claims={"sub": "1"},
+        ),
+        host_prefix="ab123",
+        dev_environment=DbtPlatformEnvironment(
+            id=2, name="dev", deployment_type="development"
+        ),
+        prod_environment=DbtPlatformEnvironment(
+            id=3, name="prod", deployment_type="production"
+        ),
+        account_id=4,
+    )
+
+
+async def test_get_credentials_runs_oauth_once_for_concurrent_callers(tmp_path):
+    settings = DbtMcpSettings.model_construct(
+        dbt_host="ab123.us1.dbt.com",
+        dbt_profiles_dir=str(tmp_path),
+        disable_dbt_cli=True,
+    )
+    credentials_provider = CredentialsProvider(settings)
+
+    async def fake_get_dbt_platform_context(**_):
+        await asyncio.sleep(0)
+        return _dbt_platform_context()
+
+    with (
+        patch.dict(os.environ, {"ENABLE_EXPERIMENAL_SECURE_OAUTH": "true"}),
+        patch(
+            "dbt_mcp.config.settings.get_dbt_platform_context",
+            side_effect=fake_get_dbt_platform_context,
+        ) as get_dbt_platform_context,
+    ):
+        results = await asyncio.gather(
+            *(credentials_provider.get_credentials() for _ in range(3))
+        )
+
+    get_dbt_platform_context.assert_called_once()
+    assert all(token_provider is results[0][1] for _, token_provider in results)
+    assert settings.dbt_host == "us1.dbt.com"
+    assert settings.dbt_token == "access_token"
+
+
+async def test_get_credentials_validates_static_token_settings_once():
+    settings = DbtMcpSettings.model_construct(
+        dbt_host="cloud.getdbt.com",
+        dbt_prod_env_id=1,
+        dbt_dev_env_id=2,
+        dbt_user_id=3,
+        dbt_token="token",
+        disable_dbt_cli=True,
+    )
+    credentials_provider = CredentialsProvider(settings)
+
+    with patch(
+        "dbt_mcp.config.settings.validate_dbt_platform_settings",
+        wraps=validate_dbt_platform_settings,
+    ) as validate:
+        _, token_provider = await credentials_provider.get_credentials()
+
+    validate.assert_called_once_with(settings)
+    assert token_provider.get_token() == "token"
+
+
+def test_dbt_project_yml_picks_up_file_changes(tmp_path):
+    project_file = tmp_path / "dbt_project.yml"
+    project_file.write_text("flags:\n  send_anonymous_usage_stats: false\n")
+    settings = DbtMcpSettings.model_construct(dbt_project_dir=str(tmp_path))
+
+    assert settings.usage_tracking_enabled is False
+
+    project_file.write_text("flags:\n  send_anonymous_usage_stats: true\n")
+    stat = project_file.stat()
+    os.utime(project_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert settings.usage_tracking_enabled is True
+
+
+@pytest.mark.parametrize(
+    "dbt_host, rejected",
+    [
+        ("metadata.cloud.getdbt.com", True),
+        ("semantic-layer.cloud.getdbt.com", True),
+        ("cloud.getdbt.com", False),
+    ],
+)
+def test_validate_rejects_service_subdomain_hosts(dbt_host, rejected):
+    settings = DbtMcpSettings.model_construct(
+        dbt_host=dbt_host,
+        dbt_prod_env_id=1,
+        dbt_dev_env_id=2,
+        dbt_user_id=3,
+        dbt_token="token",
+    )
+
+    errors = validate_dbt_platform_settings(settings)
+
+    assert (
+        "DBT_HOST must not start with 'metadata' or 'semantic-layer'." in errors
+    ) is rejected
+
+
+async def test_get_dbt_platform_context_skips_lock_for_fresh_context(tmp_path):
+    dbt_ctx = _dbt_platform_context()
+    context_manager = Mock()
+    context_manager.read_context.return_value = dbt_ctx
+
+    with patch("filelock.FileLock") as file_lock:
+        result = await get_dbt_platform_context(
+            dbt_user_dir=tmp_path,
+            dbt_platform_url="https://ab123.us1.dbt.com",
+            dbt_platform_context_manager=context_manager,
+        )
+
+    assert result is dbt_ctx
+    file_lock.assert_not_called()
+
+
+async def test_get_dbt_platform_context_rechecks_context_under_lock(tmp_path):
+    dbt_ctx = _dbt_platform_context()
+    context_manager = Mock()
+    # Another instance logs in while this one waits for the lock
+    context_manager.read_context.side_effect = [None, dbt_ctx]
+
+    with (
+        patch("filelock.FileLock") as file_lock,
+        patch("dbt_mcp.oauth.login.login") as login,
+    ):
+        result = await get_dbt_platform_context(
+            dbt_user_dir=tmp_path,
+            dbt_platform_url="https://ab123.us1.dbt.com",
+            dbt_platform_context_manager=context_manager,
+        )
+
+    assert result is dbt_ctx
+    file_lock.assert_called_once_with(tmp_path / "mcp.lock")
+    login.assert_not_called()
@@ -0,0 +1,36 @@
+import os
+from unittest.mock import patch
+
+import yaml
+
+from dbt_mcp.config.yaml import try_read_yaml
+
+
+def test_try_read_yaml_reads_alternate_suffix(tmp_path):
+    (tmp_path / "dbt_project.yaml").write_text("name: my_project\n")
+
+    assert try_read_yaml(tmp_path / "dbt_project.yml") == {"name": "my_project"}
+
+
+def test_try_read_yaml_returns_none_for_missing_or_non_yaml(tmp_path):
+    (tmp_path / "dbt_project.txt").write_text("name: my_project\n")
+
+    assert try_read_yaml(tmp_path / "dbt_project.yml") is None
+    assert try_read_yaml(tmp_path / "dbt_project.txt") is None
+
+
+def test_try_read_yaml_caches_until_file_changes(tmp_path):
+    file_path = tmp_path / "dbt_project.yml"
+    file_path.write_text("name: first\n")
+
+    with patch("dbt_mcp.config.yaml.yaml.load", wraps=yaml.load) as load:
+        assert try_read_yaml(file_path) == {"name": "first"}
+        assert try_read_yaml(file_path) == {"name": "first"}
+        assert load.call_count == 1
+
+        file_path.write_text("name: second_value\n")
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert try_read_yaml(file_path) == {"name": "second_value"}
+        assert load.call_count == 2
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -73,7 +75,7 @@ async def test_client_initialization(client):
     assert headers["Accept"] == "application/json"
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_make_request_success(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": "test"}
@@ -89,7 +91,7 @@ async def test_make_request_success(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_make_request_failure(mock_request, client):
     mock_response = Mock()
     mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
@@ -101,7 +103,28 @@ async def test_make_request_failure(mock_request, client):
         await client._make_request("GET", "/test/endpoint")
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
+async def test_make_request_does_not_block_event_loop(mock_request, client):
+    # Both requests must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    mock_response = Mock()
+    mock_response.json.return_value = {"data": "test"}
+
+    def wait_for_other_request(*args, **kwargs):
+        barrier.wait()
+        return mock_response
+
+    mock_request.side_effect = wait_for_other_request
+
+    results = await asyncio.gather(
+        client._make_request("GET", "/first"),
+        client._make_request("GET", "/second"),
+    )
+
+    assert results == [{"data": "test"}, {"data": "test"}]
+
+
+@patch("requests.Session.request")
 async def test_list_jobs(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
@@ -150,7 +173,7 @@ async def test_list_jobs(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_list_jobs_with_null_values(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
@@ -179,7 +202,20 @@ async def test_list_jobs_with_null_values(mock_request, client):
     assert result[0]["schedule"] is None
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
+async def test_list_jobs_can_be_called_repeatedly(mock_request, client):
+    mock_response = Mock()
+    mock_response.json.return_value = {"data": []}
+    mock_request.return_value = mock_response
+
+    assert await client.list_jobs(12345) == []
+    assert await client.list_jobs(12345) == []
+    assert await client.list_jobs(12345, state=[1, 2]) == []
+
+    assert mock_request.call_count == 3
+
+
+@patch("requests.Session.request")
 async def test_get_job_details(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 1, "name": "test_job"}}
@@ -197,7 +233,7 @@ async def test_get_job_details(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_trigger_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 200, "status": "queued"}}
@@ -222,7 +258,7 @@ async def test_trigger_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_list_jobs_runs(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
@@ -313,7 +349,7 @@ async def test_list_jobs_runs(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_get_job_run_details(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
@@ -348,7 +384,7 @@ async def test_get_job_run_details(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_cancel_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 100, "status": "cancelled"}}
@@ -366,7 +402,7 @@ async def test_cancel_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_retry_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 101, "status": "queued"}}
@@ -384,7 +420,7 @@ async def test_retry_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
+@patch("requests.Session.request")
 async def test_list_job_run_artifacts(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
@@ -413,7 +449,7 @@ async def test_list_job_run_artifacts(mock_request, client):
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_get_job_run_artifact_json(mock_get, client):
     mock_response = Mock()
     mock_response.json.return_value = {"nodes": {"model.test": {}}}
@@ -433,7 +469,7 @@ async def test_get_job_run_artifact_json(mock_get, client):
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_get_job_run_artifact_text(mock_get, client):
     mock_response = Mock()
     mock_response.text = "LOG DATA"
@@ -451,7 +487,7 @@ async def test_get_job_run_artifact_text(mock_get, client):
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_get_job_run_artifact_no_step_param(mock_get, client):
     mock_response = Mock()
     mock_response.text = "artifact content"
@@ -468,7 +504,7 @@ async def test_get_job_run_artifact_no_step_param(mock_get, client):
     )
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 async def test_get_job_run_artifact_request_exception(mock_get, client):
     mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
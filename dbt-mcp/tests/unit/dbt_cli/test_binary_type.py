@@ -0,0 +1,65 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from dbt_mcp.dbt_cli.binary_type import (
+    BinaryType,
+    _detect_binary_type,
+    detect_binary_type,
+)
+
+
+@pytest.fixture
+def dbt_binary(tmp_path):
+    _detect_binary_type.cache_clear()
+    binary = tmp_path / "dbt"
+    binary.write_text("#!/bin/sh\n")
+    binary.chmod(0o755)
+    yield binary
+    _detect_binary_type.cache_clear()
+
+
+def test_detect_binary_type_runs_binary_once_per_path(dbt_binary):
+    other_binary = dbt_binary.with_name("dbt-other")
+    other_binary.write_text("#!/bin/sh\n")
+    other_binary.chmod(0o755)
+    help_result = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="dbt-fusion 2.0.0\n"
+    )
+
+    with patch(
+        "dbt_mcp.dbt_cli.binary_type.subprocess.run", return_value=help_result
+    ) as run:
+        assert detect_binary_type(str(dbt_binary)) == BinaryType.FUSION
+        assert detect_binary_type(str(dbt_binary)) == BinaryType.FUSION
+        assert detect_binary_type(str(other_binary)) == BinaryType.FUSION
+
+    assert run.call_count == 2
+
+
+def test_detect_binary_type_reruns_when_binary_changes(dbt_binary):
+    help_result = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="dbt-fusion 2.0.0\n"
+    )
+
+    with patch(
+        "dbt_mcp.dbt_cli.binary_type.subprocess.run", return_value=help_result
+    ) as run:
+        detect_binary_type(str(dbt_binary))
+        dbt_binary.write_text("#!/bin/sh\necho upgraded\n")
+        detect_binary_type(str(dbt_binary))
+
+    assert run.call_count == 2
+
+
+def test_detect_binary_type_rejects_non_executable_path(dbt_binary):
+    dbt_binary.chmod(0o644)
+
+    with (
+        patch("dbt_mcp.dbt_cli.binary_type.subprocess.run") as run,
+        pytest.raises(Exception, match="not found or not executable"),
+    ):
+        detect_binary_type(str(dbt_binary))
+
+    run.assert_not_called()
@@ -1,4 +1,5 @@
 import subprocess
+from dataclasses import replace
 
 import pytest
 from pytest import MonkeyPatch
@@ -100,7 +101,7 @@ def mock_fastmcp():
         ),
     ],
 )
-def test_show_command_limit_logic(
+async def test_show_command_limit_logic(
     monkeypatch: MonkeyPatch,
     mock_process,
     mock_fastmcp,
@@ -123,7 +124,7 @@ def test_show_command_limit_logic(
     show_tool = tools["show"]
 
     # Call show tool with test parameters
-    show_tool(sql_query=sql_query, limit=limit_param)
+    await show_tool(sql_query=sql_query, limit=limit_param)
 
     # Verify the command was called with expected arguments
     assert mock_calls
@@ -131,7 +132,7 @@ def test_show_command_limit_logic(
     assert args_list == expected_args
 
 
-def test_run_command_adds_quiet_flag_to_verbose_commands(
+async def test_run_command_adds_quiet_flag_to_verbose_commands(
     monkeypatch: MonkeyPatch, mock_process, mock_fastmcp
 ):
     # Mock Popen
@@ -149,7 +150,7 @@ def test_run_command_adds_quiet_flag_to_verbose_commands(
     run_tool = tools["run"]
 
     # Execute
-    run_tool()
+    await run_tool()
 
     # Verify
     assert mock_calls
@@ -157,7 +158,7 @@ def test_run_command_adds_quiet_flag_to_verbose_commands(
     assert "--quiet" in args_list
 
 
-def test_run_command_correctly_formatted(
+async def test_run_command_correctly_formatted(
     monkeypatch: MonkeyPatch, mock_process, mock_fastmcp
 ):
     # Mock Popen
@@ -176,7 +177,7 @@ def test_run_command_correctly_formatted(
     run_tool = tools["run"]
 
     # Run the command with a selector
-    run_tool(selector="my_model")
+    await run_tool(selector="my_model")
 
     # Verify the command is correctly formatted
     assert mock_calls
@@ -191,7 +192,7 @@ def test_run_command_correctly_formatted(
     ]
 
 
-def test_show_command_correctly_formatted(
+async def test_show_command_correctly_formatted(
     monkeypatch: MonkeyPatch, mock_process, mock_fastmcp
 ):
     # Mock Popen
@@ -209,7 +210,7 @@ def test_show_command_correctly_formatted(
     show_tool = tools["show"]
 
     # Execute
-    show_tool(sql_query="SELECT * FROM my_model")
+    await show_tool(sql_query="SELECT * FROM my_model")
 
     # Verify
     assert mock_calls
@@ -222,7 +223,7 @@ def test_show_command_correctly_formatted(
     assert args_list[5] == "--favor-state"
 
 
-def test_list_command_timeout_handling(monkeypatch: MonkeyPatch, mock_fastmcp):
+async def test_list_command_timeout_handling(monkeypatch: MonkeyPatch, mock_fastmcp):
     # Mock Popen
     class MockProcessWithTimeout:
         def communicate(self, timeout=None):
@@ -239,18 +240,18 @@ def test_list_command_timeout_handling(monkeypatch: MonkeyPatch, mock_fastmcp):
     list_tool = tools["ls"]
 
     # Test timeout case
-    result = list_tool(resource_type=["model", "snapshot"])
+    result = await list_tool(resource_type=["model", "snapshot"])
     assert "Timeout: dbt command took too long to complete" in result
     assert "Try using a specific selector to narrow down the results" in result
 
     # Test with selector - should still timeout
-    result = list_tool(selector="my_model", resource_type=["model"])
+    result = await list_tool(selector="my_model", resource_type=["model"])
     assert "Timeout: dbt command took too long to complete" in result
     assert "Try using a specific selector to narrow down the results" in result
 
 
 @pytest.mark.parametrize("command_name", ["run", "build"])
-def test_full_refresh_flag_added_to_command(
+async def test_full_refresh_flag_added_to_command(
     monkeypatch: MonkeyPatch, mock_process, mock_fastmcp, command_name
 ):
     mock_calls = []
@@ -265,7 +266,7 @@ def test_full_refresh_flag_added_to_command(
     register_dbt_cli_tools(fastmcp, mock_dbt_cli_config)
     tool = tools[command_name]
 
-    tool(is_full_refresh=True)
+    await tool(is_full_refresh=True)
 
     assert mock_calls
     args_list = mock_calls[0]
@@ -273,7 +274,7 @@ def test_full_refresh_flag_added_to_command(
 
 
 @pytest.mark.parametrize("command_name", ["build", "run", "test"])
-def test_vars_flag_added_to_command(
+async def test_vars_flag_added_to_command(
     monkeypatch: MonkeyPatch, mock_process, mock_fastmcp, command_name
 ):
     mock_calls = []
@@ -288,7 +289,7 @@ def test_vars_flag_added_to_command(
     register_dbt_cli_tools(fastmcp, mock_dbt_cli_config)
     tool = tools[command_name]
 
-    tool(vars="environment: production")
+    await tool(vars="environment: production")
 
     assert mock_calls
     args_list = mock_calls[0]
@@ -296,7 +297,9 @@ def test_vars_flag_added_to_command(
     assert "environment: production" in args_list
 
 
-def test_vars_not_added_when_none(monkeypatch: MonkeyPatch, mock_process, mock_fastmcp):
+async def test_vars_not_added_when_none(
+    monkeypatch: MonkeyPatch, mock_process, mock_fastmcp
+):
     mock_calls = []
 
     def mock_popen(args, **kwargs):
@@ -309,8 +312,26 @@ def test_vars_not_added_when_none(monkeypatch: MonkeyPatch, mock_process, mock_f
     register_dbt_cli_tools(fastmcp, mock_dbt_cli_config)
     build_tool = tools["build"]
 
-    build_tool()  # Non-explicit
+    await build_tool()  # Non-explicit
 
     assert mock_calls
     args_list = mock_calls[0]
     assert "--vars" not in args_list
+
+
+def test_read_file(tmp_path, mock_fastmcp):
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "orders.sql").write_text("select 1")
+
+    fastmcp, tools = mock_fastmcp
+    register_dbt_cli_tools(
+        fastmcp, replace(mock_dbt_cli_config, project_dir=str(tmp_path))
+    )
+    read_file_tool = tools["read_file"]
+
+    assert read_file_tool(file_path="models/orders.sql") == "select 1"
+    assert read_file_tool(file_path="models") == "Error: Path is not a file: models"
+    assert (
+        read_file_tool(file_path="models/missing.sql")
+        == "Error: File not found: models/missing.sql"
+    )